@@ -1,69 +1,48 @@
-import timeit
+from time import perf_counter_ns
+
+from colordoll import default_colorizer, dark_theme_colors, darktheme
+
+
+def bench(name, fn, runs, repeats=5):
+    """Times `runs` calls of `fn` in a plain loop, `repeats` times, and reports ns per call."""
+    fn()  # warm up
+    times = []
+    for _ in range(repeats):
+        start = perf_counter_ns()
+        for _ in range(runs):
+            fn()
+        times.append((perf_counter_ns() - start) / runs)
+    print(f"\n{name} - {runs} runs:")
+    print(f"  Min time: {min(times):.1f} ns/call")
+    print(f"  Max time: {max(times):.1f} ns/call")
+    print(f"  Avg time: {sum(times)/len(times):.1f} ns/call")
 
 
 # --- Performance Benchmarks ---
 print("\n--- Performance Benchmarks ---")
 
 # Benchmark colorize function
-colorize_setup = """
-from colordoll import default_colorizer
 text = "Performance test string"
-"""
-colorize_statement = """
-default_colorizer.colorize(text, color="red", background_color="bg_blue")
-"""
-colorize_timer = timeit.Timer(colorize_statement, setup=colorize_setup)
-colorize_runs = 10000
-colorize_times = colorize_timer.repeat(20, colorize_runs)
-print(f"Colorize function - {colorize_runs} runs:")
-print(f"  Min time: {min(colorize_times)/colorize_runs:.6f} sec")
-print(f"  Max time: {max(colorize_times)/colorize_runs:.6f} sec")
-print(
-    f"  Avg time: {sum(colorize_times)/len(colorize_times)/colorize_runs:.6f} sec")
+bench(
+    "Colorize function",
+    lambda: default_colorizer.colorize(text, color="red", background_color="bg_blue"),
+    10000,
+    repeats=20,
+)
 
 # Benchmark theme_colorize function
-theme_colorize_setup = """
-from colordoll import default_colorizer, dark_theme_colors
 data = {"key1": "value1", "key2": 123, "key3": True, "key4": None, "key5": [1, 2, "three"]}
-"""
-theme_colorize_statement = """
-default_colorizer.theme_colorize(data, dark_theme_colors)
-"""
-theme_colorize_timer = timeit.Timer(
-    theme_colorize_statement, setup=theme_colorize_setup)
-theme_colorize_runs = 10000
-theme_colorize_times = theme_colorize_timer.repeat(5, theme_colorize_runs)
+bench(
+    "Theme colorize function",
+    lambda: default_colorizer.theme_colorize(data, dark_theme_colors),
+    10000,
+)
 
-print(f"\nTheme colorize function - {theme_colorize_runs} runs:")
-print(
-    f"  Min time: {min(theme_colorize_times)/theme_colorize_runs:.6f} sec")
-print(
-    f"  Max time: {max(theme_colorize_times)/theme_colorize_runs:.6f} sec")
-print(
-    f"  Avg time: {sum(theme_colorize_times)/len(theme_colorize_times)/theme_colorize_runs:.6f} sec")
 
 # Benchmark themed decorator
-themed_decorator_setup = """
-from colordoll import darktheme
-
 @darktheme
 def dummy_function():
     return {"key": "value", "number": 10}
-"""
-themed_decorator_statement = """
-dummy_function()
-"""
 
-themed_decorator_timer = timeit.Timer(
-    themed_decorator_statement, setup=themed_decorator_setup)
-themed_decorator_runs = 10000
-themed_decorator_times = themed_decorator_timer.repeat(
-    5, themed_decorator_runs)
 
-print(f"\nThemed Decorator - {themed_decorator_runs} runs:")
-print(
-    f"  Min time: {min(themed_decorator_times)/themed_decorator_runs:.6f} sec")
-print(
-    f"  Max time: {max(themed_decorator_times)/themed_decorator_runs:.6f} sec")
-print(
-    f"  Avg time: {sum(themed_decorator_times)/len(themed_decorator_times)/themed_decorator_runs:.6f} sec")
+bench("Themed Decorator", dummy_function, 10000)
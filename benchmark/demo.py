@@ -1,56 +1,81 @@
 from colordoll import default_colorizer, vibranttheme, minimalisttheme, darktheme, DataHandler, YamlHandler, ColorRemoverHandler, vibrant_theme_colors, dark_theme_colors, magenta, red, green, blue, bright_cyan, bright_yellow, wrapmono
+import contextlib
+import io
+import sys
 import yaml
 import random
 from typing import Dict
 
+SEP_CYAN = default_colorizer.colorize("-" * 40, "cyan")
+SEP_GREEN = default_colorizer.colorize("-" * 40, "green")
+SEP_RED_BLACK = default_colorizer.colorize("-" * 40, "red", "black")
+SEP_BLACK_BRIGHT_GREEN = default_colorizer.colorize("-" * 40, "black", "bright_green")
+SEP_BRIGHT_YELLOW = default_colorizer.colorize("-" * 40, "bright_yellow")
+SEP_STARS = " * " * 20
 
-if __name__ == "__main__":
-    print("Welcome to the artistic colordoll demo!\n")
 
-    colorizer = default_colorizer  # Updated from _default_colorizer
+def run_demo(use_factory_theme: bool = True, show_wrapmono: bool = True) -> None:
+    """
+    Runs the artistic demo and writes its output to stdout in one go.
 
-    print(colorizer.colorize("-" * 40, "cyan"))
-    print(colorizer.colorize("  Demonstrating Basic Colored Lines", "bright_white"))
-    print(colorizer.colorize("-" * 40, "cyan"))
+    Args:
+        use_factory_theme (bool, optional): Decorate the minimalist heart with
+            ``@minimalisttheme(True)`` rather than the bare ``@minimalisttheme``. Defaults to True.
+        show_wrapmono (bool, optional): Include the wrapmono / nested decorator section. Defaults to True.
+    """
+    # Collect the whole demo in memory and hand it to the terminal in one write.
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        print("Welcome to the artistic colordoll demo!\n")
 
-    print(colorizer.colorize("Red", "red") + colorizer.colorize(" Line: ") + colorizer.colorize("---", "red"))
-    print(colorizer.colorize("Green", "green") + colorizer.colorize(" Line: ") + colorizer.colorize("---", "green"))
-    print(colorizer.colorize("Blue", "blue") + colorizer.colorize(" Line: ") + colorizer.colorize("---", "blue"))
-    print()
+        colorizer = default_colorizer  # Updated from _default_colorizer
 
-    print(colorizer.colorize("-" * 40, "cyan"))
-    print(colorizer.colorize("  Creating a Simple Colored Square", "bright_white"))
-    print(colorizer.colorize("-" * 40, "cyan"))
+        print(SEP_CYAN)
+        print(colorizer.colorize("  Demonstrating Basic Colored Lines", "bright_white"))
+        print(SEP_CYAN)
 
-    square_color = "bright_green"
-    square_side = 20
-    for i in range(square_side):
-        if i in [0, square_side - 1]:
-            line = colorizer.colorize("██" * square_side, square_color)
-        else:
-            insides = random.randint(1, (3 + (square_side % random.randint(2, square_side // 4))))
-            middle_section = "██" * insides
-            spaces = " " * (square_side - 2 - insides)
-            line_content = f" █{spaces}{magenta(middle_section)}{spaces}█ "  # magenta() uses default_colorizer
-            line = colorizer.colorize(text=line_content, color="red", background_color="grey")
-        print(line)
+        print(colorizer.colorize("Red", "red") + " Line: " + colorizer.colorize("---", "red"))
+        print(colorizer.colorize("Green", "green") + " Line: " + colorizer.colorize("---", "green"))
+        print(colorizer.colorize("Blue", "blue") + " Line: " + colorizer.colorize("---", "blue"))
+        print()
 
-    print()
+        print(SEP_CYAN)
+        print(colorizer.colorize("  Creating a Simple Colored Square", "bright_white"))
+        print(SEP_CYAN)
+
+        square_color = "bright_green"
+        square_side = 20
+        last = square_side - 1
+        # Draw every row's inner width up front rather than two randint() calls per row.
+        bases = random.choices(range(2, square_side // 4 + 1), k=square_side)
+        widths = [random.randrange(1, 4 + square_side % base) for base in bases]
+        square_lines = []
+        for i in range(square_side):
+            if i == 0 or i == last:
+                line = colorizer.colorize("██" * square_side, square_color)
+            else:
+                insides = widths[i]
+                middle_section = "██" * insides
+                spaces = " " * (square_side - 2 - insides)
+                line_content = f" █{spaces}{magenta(middle_section)}{spaces}█ "  # magenta() uses default_colorizer
+                line = colorizer.colorize(text=line_content, color="red", background_color="grey")
+            square_lines.append(line)
+        print("\n".join(square_lines))
 
-    print(colorizer.colorize("-" * 40, "red", "black"))
-    print(colorizer.colorize("  Creating a Colored Heart Text Art    ", "black", "magenta"))
-    print(colorizer.colorize("-" * 40, "red", "black"))
+        print()
 
-    heart_art = (
-        """
+        print(SEP_RED_BLACK)
+        print(colorizer.colorize("  Creating a Colored Heart Text Art    ", "black", "magenta"))
+        print(SEP_RED_BLACK)
+
+        heart_top = """
 
      ███   ███
     █████ █████
    █████████████
   ███████████████
  ██████"""
-        + (red("1") + green(" 2 ") + blue("3"))  # red(), green(), blue() use default_colorizer
-        + """██████
+        heart_bottom = """██████
  █████████████████
   ███████████████
    █████████████
@@ -62,161 +87,173 @@ if __name__ == "__main__":
          █
 
     """
-    )
-
-    heart_lines = heart_art.split("\n")
-    heart_colors = ["bright_red", "red", "magenta", "bright_magenta"]
-
-    for i, line in enumerate(heart_lines):
-        colored_line = ""
-        color_index = i % len(heart_colors)
-        line_color = heart_colors[color_index]
-        colored_line = colorizer.colorize(line, line_color)
-        print(colored_line)
-    print()
-
-    print(colorizer.colorize("-" * 40, "black", "bright_green"))
-    print(colorizer.colorize("  Themed Heart Art (Minimalist)      ", "bright_white"))
-    print(colorizer.colorize("-" * 40, "black", "bright_green"))
-
-    @minimalisttheme(True)  # minimalisttheme uses default_colorizer
-    def get_minimalist_heart(heart_art) -> str:
-        return heart_art
-
-    print(get_minimalist_heart(heart_art=heart_art))
-    print()
-
-    # Themed Heart Art (Vibrant with Background)
-
-    print(colorizer.colorize("-" * 40, "green"))
-    print(colorizer.colorize("  Themed Heart Art (Vibrant with Background)", color="bright_white"))
-    print(colorizer.colorize("-" * 40, "green"))
-
-    @vibranttheme  # vibranttheme uses default_colorizer
-    def get_vibrant_heart() -> str:
-        """
-        Provides a vibrant heart art string with colorized elements.
-        """
-        return heart_art
-
-    print(get_vibrant_heart())
-    print()
-
-    print(colorizer.colorize("-" * 40, "cyan"))
-    print(colorizer.colorize("  Themed JSON Data Display (Dark Theme)", "bright_white"))
-    print(colorizer.colorize("-" * 40, "cyan"))
-
-    sample_json_data = {"name": "Artistic Demo", "type": "Text Art", "colors_used": ["red", "green", "blue", "yellow"], "is_artistic": True, "value": 123}
-
-    @darktheme  # darktheme uses default_colorizer
-    def get_themed_json_data() -> Dict:
-        return sample_json_data
-
-    print(get_themed_json_data())
-    print()
-
-    print(colorizer.colorize("-" * 40, "cyan"))
-    print(colorizer.colorize("  Direct Color Functions Example (Corrected)", "bright_white"))
-    print(colorizer.colorize("-" * 40, "cyan"))
-    print()
-
-    print(bright_cyan("This message is in bright cyan."))  # bright_cyan() uses default_colorizer
-    print(bright_yellow("And this one is in bright yellow."))  # bright_yellow() uses default_colorizer
-    print()
-
-    print(colorizer.colorize("-" * 40, "cyan"))
-    print(colorizer.colorize("  End of colordoll Artistic Demo", "bright_white"))
-    print(colorizer.colorize("-" * 40, "cyan"))
-    print()
-    print()
-    print()
-
-    sample_data = {"name": "Handler Demo", "formats": ["JSON", "Dict/List", "YAML", "HTML", "Color Removed"], "value": 123, "is_demo": True, "nested": {"item": "nested_value", "list": [1, 2, "three"]}}
-
-    print(" * " * 20)
-    print(default_colorizer.colorize("Demonstrating Output Handlers", "bright_white"))  # Updated
-    print(" * " * 20)
-    print()
-
-    print(default_colorizer.colorize("-" * 40, "green"))  # Updated
-    print(default_colorizer.colorize("  JSON (Gets converted) Output", "bright_white"))  # Updated
-    print(default_colorizer.colorize("-" * 40, "green"))  # Updated
-    print(default_colorizer.theme_colorize(sample_data, dark_theme_colors))  # Updated
-    print()
-
-    print(default_colorizer.colorize("-" * 40, "cyan"))  # Updated
-    print(default_colorizer.colorize("  Dict/List Handler Output", "bright_white"))  # Updated
-    # The following line uses 'colorizer' which is 'default_colorizer'
-    print(colorizer.colorize("-" * 40, "cyan"))
-    default_colorizer.set_output_handler(DataHandler())  # Updated
-    print(default_colorizer.theme_colorize(sample_data, dark_theme_colors))  # Updated
-
-    if yaml is not None:
-        print(default_colorizer.colorize("-" * 40, "bright_yellow"))  # Updated
-        print(default_colorizer.colorize("  YAML Handler Output", "bright_white"))  # Updated
-        print(default_colorizer.colorize("-" * 40, "bright_yellow"))  # Updated
-        default_colorizer.set_output_handler(YamlHandler())  # Updated
-
-        def getyaml() -> str:
-            return default_colorizer.theme_colorize(sample_data, dark_theme_colors)  # Updated
-
-        print(getyaml())
-    else:
-        print(default_colorizer.colorize("YAML Handler skipped due to PyYAML installation issue.", "yellow"))  # Updated
+        # red(), green(), blue() use default_colorizer
+        heart_art = "".join([heart_top, red("1"), green(" 2 "), blue("3"), heart_bottom])
+
+        heart_lines = heart_art.split("\n")
+        heart_colors = ["bright_red", "red", "magenta", "bright_magenta"]
+        # Four colors, so "i & 3" cycles through them like "i % 4". The line color is
+        # re-applied after any reset inside the line, as colorize() would do.
+        heart_prefixes = tuple(colorizer.get_color_code(color) for color in heart_colors)
+        reset = "\033[0m"
+        heart_restarts = tuple(reset + prefix for prefix in heart_prefixes)
+        print("\n".join(
+            f"{heart_prefixes[i & 3]}{line.replace(reset, heart_restarts[i & 3])}{reset}"
+            for i, line in enumerate(heart_lines)
+        ))
+        print()
+
+        print(SEP_BLACK_BRIGHT_GREEN)
+        print(colorizer.colorize("  Themed Heart Art (Minimalist)      ", "bright_white"))
+        print(SEP_BLACK_BRIGHT_GREEN)
+
+        minimalist = minimalisttheme(True) if use_factory_theme else minimalisttheme
+
+        @minimalist  # minimalisttheme uses default_colorizer
+        def get_minimalist_heart(heart_art) -> str:
+            return heart_art
+
+        print(get_minimalist_heart(heart_art=heart_art))
+        print()
+
+        # Themed Heart Art (Vibrant with Background)
+
+        print(SEP_GREEN)
+        print(colorizer.colorize("  Themed Heart Art (Vibrant with Background)", color="bright_white"))
+        print(SEP_GREEN)
+
+        @vibranttheme  # vibranttheme uses default_colorizer
+        def get_vibrant_heart() -> str:
+            """
+            Provides a vibrant heart art string with colorized elements.
+            """
+            return heart_art
+
+        print(get_vibrant_heart())
+        print()
+
+        print(SEP_CYAN)
+        print(colorizer.colorize("  Themed JSON Data Display (Dark Theme)", "bright_white"))
+        print(SEP_CYAN)
+
+        sample_json_data = {"name": "Artistic Demo", "type": "Text Art", "colors_used": ["red", "green", "blue", "yellow"], "is_artistic": True, "value": 123}
+
+        @darktheme  # darktheme uses default_colorizer
+        def get_themed_json_data() -> Dict:
+            return sample_json_data
+
+        print(get_themed_json_data())
+        print()
+
+        print(SEP_CYAN)
+        print(colorizer.colorize("  Direct Color Functions Example (Corrected)", "bright_white"))
+        print(SEP_CYAN)
         print()
 
-    print(default_colorizer.colorize("-" * 40, "cyan"))  # Updated
-    print(default_colorizer.colorize("  Color Remover Handler Output", "bright_white"))  # Updated
-    print(default_colorizer.colorize("-" * 40, "cyan"))  # Updated
-    default_colorizer.set_output_handler(ColorRemoverHandler())  # Updated
-    removed_color_output = default_colorizer.theme_colorize(sample_data, dark_theme_colors)  # Updated
-    print(f"{removed_color_output}")
-
-    default_colorizer.set_output_handler(DataHandler())  # Updated
-    print(default_colorizer.theme_colorize(removed_color_output, vibrant_theme_colors))  # Updated
-
-    print(" * " * 20)
-    print(default_colorizer.colorize("End of Output Handler Demo", "bright_white"))  # Updated
-    print(" * " * 20)
-
-    # some fun new abilities to wrap and nest wrap printing
-
-    # will print the dict when called.
-    @darktheme()
-    def thing1():
-        """
-        dict: A dictionary with a single key-value pair.
-        """
-        return {"mynumber": 1234}
-
-    # create a single color wrapper
-    red_themed = wrapmono("red")
-
-    @red_themed(True)
-    def thing2():
-        """
-        dict: A dictionary with a wrappped single key-value pair.
-        """
-        return {"the_other_thing": "This is a string"}
-
-    @vibranttheme(True)
-    def thing_double():
-        """
-        dict: A dictionary with a wrappped single key-value pair.
-        """
-        return {
-            # with not print here, will nest colorization,  but the value is now the colorized string here with ansi codes.
-            "Thing1": thing1(),
-            # will Print during thing_double call in it's own color
-            # but be printed ALSO by thing_double's output overwritten by this functions vibranttheme
-            "Thing2": thing2(),
-        }
-
-    # you can do this:
-    thing_double()
-
-    # or this
-    print(thing_double())
+        print(bright_cyan("This message is in bright cyan."))  # bright_cyan() uses default_colorizer
+        print(bright_yellow("And this one is in bright yellow."))  # bright_yellow() uses default_colorizer
+        print()
+
+        print(SEP_CYAN)
+        print(colorizer.colorize("  End of colordoll Artistic Demo", "bright_white"))
+        print(SEP_CYAN)
+        print()
+        print()
+        print()
+
+        sample_data = {"name": "Handler Demo", "formats": ["JSON", "Dict/List", "YAML", "HTML", "Color Removed"], "value": 123, "is_demo": True, "nested": {"item": "nested_value", "list": [1, 2, "three"]}}
+
+        print(SEP_STARS)
+        print(default_colorizer.colorize("Demonstrating Output Handlers", "bright_white"))  # Updated
+        print(SEP_STARS)
+        print()
+
+        print(SEP_GREEN)
+        print(default_colorizer.colorize("  JSON (Gets converted) Output", "bright_white"))  # Updated
+        print(SEP_GREEN)
+        print(default_colorizer.theme_colorize(sample_data, dark_theme_colors))  # Updated
+        print()
+
+        print(SEP_CYAN)
+        print(default_colorizer.colorize("  Dict/List Handler Output", "bright_white"))  # Updated
+        print(SEP_CYAN)
+        default_colorizer.set_output_handler(DataHandler())  # Updated
+        print(default_colorizer.theme_colorize(sample_data, dark_theme_colors))  # Updated
+
+        if yaml is not None:
+            print(SEP_BRIGHT_YELLOW)
+            print(default_colorizer.colorize("  YAML Handler Output", "bright_white"))  # Updated
+            print(SEP_BRIGHT_YELLOW)
+            default_colorizer.set_output_handler(YamlHandler())  # Updated
+
+            def getyaml() -> str:
+                return default_colorizer.theme_colorize(sample_data, dark_theme_colors)  # Updated
+
+            print(getyaml())
+        else:
+            print(default_colorizer.colorize("YAML Handler skipped due to PyYAML installation issue.", "yellow"))  # Updated
+            print()
+
+        print(SEP_CYAN)
+        print(default_colorizer.colorize("  Color Remover Handler Output", "bright_white"))  # Updated
+        print(SEP_CYAN)
+        default_colorizer.set_output_handler(ColorRemoverHandler())  # Updated
+        removed_color_output = default_colorizer.theme_colorize(sample_data, dark_theme_colors)  # Updated
+        print(f"{removed_color_output}")
+
+        default_colorizer.set_output_handler(DataHandler())  # Updated
+        print(default_colorizer.theme_colorize(removed_color_output, vibrant_theme_colors))  # Updated
+
+        print(SEP_STARS)
+        print(default_colorizer.colorize("End of Output Handler Demo", "bright_white"))  # Updated
+        print(SEP_STARS)
+
+        if show_wrapmono:
+            # some fun new abilities to wrap and nest wrap printing
+
+            # will print the dict when called.
+            @darktheme()
+            def thing1():
+                """
+                dict: A dictionary with a single key-value pair.
+                """
+                return {"mynumber": 1234}
+
+            # create a single color wrapper
+            red_themed = wrapmono("red")
+
+            @red_themed(True)
+            def thing2():
+                """
+                dict: A dictionary with a wrappped single key-value pair.
+                """
+                return {"the_other_thing": "This is a string"}
+
+            @vibranttheme(True)
+            def thing_double():
+                """
+                dict: A dictionary with a wrappped single key-value pair.
+                """
+                return {
+                    # with not print here, will nest colorization,  but the value is now the colorized string here with ansi codes.
+                    "Thing1": thing1(),
+                    # will Print during thing_double call in it's own color
+                    # but be printed ALSO by thing_double's output overwritten by this functions vibranttheme
+                    "Thing2": thing2(),
+                }
+
+            # you can do this:
+            thing_double()
+
+            # or this
+            print(thing_double())
+
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    run_demo()
 
     # there's some chaining nd nestinng rules i don't have time for atm.. will do soonish.
     # but prints like this
@@ -5,10 +5,12 @@ for colorized output. The module also supports YAML and JSON formatting with col
 """
 
 import contextlib
+import itertools
 import json
 import re
+import sys
 from functools import wraps
-from typing import Dict, Union, Optional, Any, Callable, TypeVar
+from typing import Dict, List, Tuple, Union, Optional, Any, Callable, TypeVar
 import yaml
 
 
@@ -77,6 +79,13 @@ vibrant_theme_colors: Dict[str, str] = {
 }
 
 
+# Theme roles, used as indexes into a resolved theme table (see DataHandler._resolve_theme).
+_KEY, _STRING, _NUMBER, _BOOL, _NULL, _OTHER, _PUNCTUATION = range(7)
+
+# Theme dictionary key for each role, in index order (punctuation is always grey).
+_THEME_ROLES = ("key", "string", "number", "bool", "null", "other")
+
+
 class ColoredData(str):
     """
     A string subclass that masquerades as the original data object.
@@ -144,6 +153,7 @@ class AnsiColor:
 
     code: int
     name: str
+    _esc: str
 
     def __init__(self, code: int, name: str = "") -> None:
         """
@@ -160,10 +170,11 @@ class AnsiColor:
             raise ValueError("ANSI code must be an integer")
         self.code = code
         self.name = name
+        self._esc = f"\033[{code}m"
 
     def __str__(self) -> str:
         """Returns the ANSI escape code sequence as a string."""
-        return "\033[" + str(self.code) + "m"
+        return self._esc
 
     def __repr__(self) -> str:
         """Returns a string representation of the AnsiColor object."""
@@ -233,6 +244,7 @@ class ColorConfig:
     """Manages color configurations."""
 
     config: Dict
+    _cache: Dict[str, AnsiColor]
 
     def __init__(self, config_source: Union[str, Dict, Any] = None) -> None:
         """
@@ -242,6 +254,7 @@ class ColorConfig:
             config_source (Union[str, Dict, Any], optional): Configuration source (file, dict, string). Defaults to None.
         """
         self.config = ConfigLoader().load_config(config_source)
+        self._cache: Dict[str, AnsiColor] = {}
 
     def get_color_code(self, color_name: str) -> str:
         """
@@ -314,7 +327,82 @@ class ColorConfig:
             raise ValueError(
                 f"Invalid color configuration for '{color_name}': missing 'code' field"
             )
-        return AnsiColor(code=color_data["code"], name=color_name)
+        code = color_data["code"]
+        # The config is read on every lookup, so a cached object is reused only while its
+        # entry still holds the same integer code; anything else is rebuilt (and validated).
+        color_obj = self._cache.get(color_name)
+        if color_obj is None or type(code) is not int or color_obj.code != code:
+            color_obj = self._cache[color_name] = AnsiColor(code=code, name=color_name)
+        return color_obj
+
+
+def _emit(text: str) -> None:
+    """
+    Writes text plus a trailing newline to stdout in a single write call.
+
+    Args:
+        text (str): Text to write.
+    """
+    if sys.stdout is not None:
+        sys.stdout.write(f"{text}\n")
+
+
+# SGR reset sequence, shared by every colorizing path.
+_RESET = "\033[0m"
+
+# ANSI color tables, built once at import and copied into each Colorizer.
+_ANSI_FG: Dict[str, AnsiColor] = {
+    name: AnsiColor(code, name)
+    for name, code in {
+        "black": 30,
+        "red": 31,
+        "green": 32,
+        "yellow": 33,
+        "blue": 34,
+        "magenta": 35,
+        "cyan": 36,
+        "white": 37,
+        "bright_black": 90,
+        "bright_red": 91,
+        "bright_green": 92,
+        "bright_yellow": 93,
+        "bright_blue": 94,
+        "bright_magenta": 95,
+        "bright_cyan": 96,
+        "bright_white": 97,
+        "grey": 90,
+    }.items()
+}
+# Keyed without the "bg_" prefix; each AnsiColor keeps its full "bg_" name.
+_ANSI_BG: Dict[str, AnsiColor] = {
+    name[3:]: AnsiColor(code, name)
+    for name, code in {
+        "bg_black": 40,
+        "bg_red": 41,
+        "bg_green": 42,
+        "bg_yellow": 43,
+        "bg_blue": 44,
+        "bg_magenta": 45,
+        "bg_cyan": 46,
+        "bg_white": 47,
+        "bg_bright_black": 100,
+        "bg_bright_red": 101,
+        "bg_bright_green": 102,
+        "bg_bright_yellow": 103,
+        "bg_bright_blue": 104,
+        "bg_bright_magenta": 105,
+        "bg_bright_cyan": 106,
+        "bg_bright_white": 107,
+    }.items()
+}
+
+# Merged SGR start sequences keyed on (foreground code, background code), precomputed
+# for the built-in colors. Pairs with custom codes are added on first use, up to a limit.
+_PAIR_TAGS: Dict[Tuple[int, int], str] = {
+    (fg.code, bg.code): sys.intern(f"\033[{fg.code};{bg.code}m")
+    for fg, bg in itertools.product(_ANSI_FG.values(), _ANSI_BG.values())
+}
+_PAIR_TAGS_LIMIT = 1024
 
 
 class OutputHandler:
@@ -349,9 +437,10 @@ class Colorizer:
     Methods:
         __init__: Initializes a Colorizer with optional custom config and output handler.
         set_output_handler: Sets a custom OutputHandler instance with type validation.
-        _load_ansi_colors: Populates foreground and background color mappings from ANSI codes.
+        _build_start_tag: Resolves the merged SGR start sequence for a color pair.
         get_color_code: Retrieves ANSI escape code for a given foreground color name.
         get_bg_color_code: Retrieves ANSI escape code for a given background color name.
+        _get_bg_color_obj: Looks up a background color, accepting an optional "bg_" prefix.
         colorize: Applies foreground and/or background colors to text, handling nested ANSI codes.
         color_decorator: Creates a decorator factory that colorizes function return values.
         create_themed_decorator_factory: Creates a configurable decorator factory for themed output with print control.
@@ -383,9 +472,8 @@ class Colorizer:
             output_handler (Optional[OutputHandler], optional): Output handler object. Defaults to None (uses DataHandler).
         """
         self.config = config or ColorConfig()
-        self.colors = {}
-        self.bg_colors = {}
-        self._load_ansi_colors()
+        self.colors = dict(_ANSI_FG)
+        self.bg_colors = dict(_ANSI_BG)
         self.theme = dark_theme_colors
         self.output_handler = output_handler or OutputHandler()
 
@@ -403,52 +491,6 @@ class Colorizer:
             raise TypeError("Handler must be an instance of OutputHandler")
         self.output_handler = handler
 
-    def _load_ansi_colors(self) -> None:
-        """Loads ANSI color codes for foreground and background colors."""
-        ansi_colors: Dict[str, int] = {
-            "black": 30,
-            "red": 31,
-            "green": 32,
-            "yellow": 33,
-            "blue": 34,
-            "magenta": 35,
-            "cyan": 36,
-            "white": 37,
-            "bright_black": 90,
-            "bright_red": 91,
-            "bright_green": 92,
-            "bright_yellow": 93,
-            "bright_blue": 94,
-            "bright_magenta": 95,
-            "bright_cyan": 96,
-            "bright_white": 97,
-            "grey": 90,
-        }
-        ansi_bg_colors: Dict[str, int] = {
-            "bg_black": 40,
-            "bg_red": 41,
-            "bg_green": 42,
-            "bg_yellow": 43,
-            "bg_blue": 44,
-            "bg_magenta": 45,
-            "bg_cyan": 46,
-            "bg_white": 47,
-            "bg_bright_black": 100,
-            "bg_bright_red": 101,
-            "bg_bright_green": 102,
-            "bg_bright_yellow": 103,
-            "bg_bright_blue": 104,
-            "bg_bright_magenta": 105,
-            "bg_bright_cyan": 106,
-            "bg_bright_white": 107,
-        }
-
-        for name, code in ansi_colors.items():
-            self.colors[name] = AnsiColor(code, name)
-        for name, code in ansi_bg_colors.items():
-            bg_name = name.replace("bg_", "")
-            self.bg_colors[bg_name] = AnsiColor(code, name)
-
     def get_color_code(self, color_name: str) -> str:
         """
         Retrieves the ANSI escape code for a given color name.
@@ -459,22 +501,77 @@ class Colorizer:
         Returns:
             str: ANSI color code string, or empty string if color is not defined.
         """
-        color_name = (color_name or "").lower()
+        # Names are usually already lowercase; only normalize on a miss.
         color_obj = self.colors.get(color_name)
-        return str(color_obj) if color_obj else ""
+        if color_obj is None:
+            color_obj = self.colors.get((color_name or "").lower())
+        return color_obj._esc if color_obj else ""
 
     def get_bg_color_code(self, color_name: str) -> str:
         """
         Retrieves the ANSI escape code for a background color.
 
         Args:
-            color_name (str): Name of the background color.
+            color_name (str): Name of the background color, with or without a "bg_" prefix.
 
         Returns:
             str: ANSI background color code string, or empty string if not defined.
         """
-        color_obj = self.bg_colors.get((color_name or "").lower())
-        return str(color_obj) if color_obj else ""
+        color_obj = self._get_bg_color_obj(color_name)
+        return color_obj._esc if color_obj else ""
+
+    def _get_bg_color_obj(self, color_name: Optional[str]) -> Optional[AnsiColor]:
+        """
+        Looks up a background color by name, as given first and then normalized.
+
+        Args:
+            color_name (Optional[str]): Name of the background color, with or without a "bg_" prefix.
+
+        Returns:
+            Optional[AnsiColor]: The background color, or None if it is not defined.
+        """
+        color_obj = self.bg_colors.get(color_name)
+        if color_obj is None and color_name:
+            bg_name = color_name.lower()
+            if bg_name.startswith("bg_"):
+                bg_name = bg_name[3:]
+            color_obj = self.bg_colors.get(bg_name)
+        return color_obj
+
+    def _build_start_tag(
+        self, color: Optional[str], background_color: Optional[str]
+    ) -> str:
+        """
+        Resolves the combined SGR start sequence for a color pair.
+
+        Names are looked up in this instance's color tables on every call, so edits to
+        `colors` or `bg_colors` take effect immediately. Foreground and background
+        codes are merged into a single escape sequence (e.g. "\\033[31;44m") rather
+        than two stacked ones.
+
+        Args:
+            color (Optional[str]): Foreground color name.
+            background_color (Optional[str]): Background color name, with or without a "bg_" prefix.
+
+        Returns:
+            str: The SGR start sequence, or an empty string if neither color is defined.
+        """
+        fg_obj = None
+        if color:
+            fg_obj = self.colors.get(color)
+            if fg_obj is None:
+                fg_obj = self.colors.get(color.lower())
+        bg_obj = self._get_bg_color_obj(background_color) if background_color else None
+        if fg_obj is None or bg_obj is None:
+            single = fg_obj or bg_obj
+            return single._esc if single else ""
+        key = (fg_obj.code, bg_obj.code)
+        start_tag = _PAIR_TAGS.get(key)
+        if start_tag is None:
+            start_tag = f"\033[{fg_obj.code};{bg_obj.code}m"
+            if len(_PAIR_TAGS) < _PAIR_TAGS_LIMIT:
+                _PAIR_TAGS[key] = start_tag
+        return start_tag
 
     def colorize(
         self,
@@ -493,47 +590,17 @@ class Colorizer:
         Returns:
             str: Colorized text string.
         """
-        reset_code = str(self.RESET)
-        color_code = self.get_color_code(color) if color else ""
-        bg_color_code = (
-            self.get_bg_color_code(background_color) if background_color else ""
-        )
-
-        if not color_code and not bg_color_code:
+        if color is None and background_color is None:
             return text
 
-        start_tag = ""
-        if all((color_code, bg_color_code)):
-            start_tag = "\033["
-            start_tag += color_code.split('[')[1].split('m')[0]
-            start_tag += ";"
-            start_tag += bg_color_code.split('[')[1].split('m')[0]
-            start_tag += "m"
-        elif color_code:
-            start_tag = color_code
-        else:
-            start_tag = bg_color_code
-
-        end_tag = reset_code
-
-        def _process_text(text_segment: str) -> str:
-            processed_segments = []
-            i = 0
-            while i < len(text_segment):
-                if text_segment.startswith(reset_code, i):
-                    processed_segments.append(reset_code)
-                    i += len(reset_code)
-                    processed_segments.append(start_tag)  # Re-apply style
-                else:
-                    processed_segments.append(text_segment[i])
-                    i += 1
-            return "".join(processed_segments)
+        start_tag = self._build_start_tag(color, background_color)
+        if not start_tag:
+            return text
 
-        result = start_tag + _process_text(text) + end_tag
         # Wrap in ColoredData so that when this value is embedded in a container
         # (e.g., dict/list) and printed, the ANSI codes are preserved instead of
         # being escaped (e.g., "\\x1b").
-        return ColoredData(result, text)
+        return ColoredData(_paint(text, start_tag), text)
 
     def color_decorator(self, color_name: str) -> Callable:
         """
@@ -550,6 +617,10 @@ class Colorizer:
             @wraps(func)
             def wrapper(*args, **kwargs):
                 result = func(*args, **kwargs)
+                # Fast path for the common case: a str result needs no type checks or str() copy.
+                # The color is still resolved per call, so edits to `colors` apply to every result.
+                if type(result) is str:
+                    return self.colorize(result, color_name)
                 if isinstance(result, (str, bool, float, int, dict, list, type(None))):
                     return self.colorize(str(result), color_name)
                 try:
@@ -603,7 +674,7 @@ class Colorizer:
                         original_result, theme_colors
                     )
                     if do_print_setting:
-                        print(themed_result)
+                        _emit(themed_result)
                         return original_result  # Return the original, non-themed result
                     else:
                         return ColoredData(themed_result, original_result)
@@ -659,13 +730,57 @@ class Colorizer:
             self, f"{theme_name}_theme_colors", self.theme
         )  # specific logic needed to find theme dict
         # ... logic to find theme ...
-        print(self.output_handler.format(data, theme_colors))
+        _emit(self.output_handler.format(data, theme_colors))
+
+
+# Characters a JSON document can begin with after leading whitespace (json.loads
+# also accepts NaN and Infinity).
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
+def _paint(text: str, start_tag: str) -> str:
+    """
+    Wraps text in a precomputed start sequence and a reset, re-applying it after nested resets.
+
+    Args:
+        text (str): Text to wrap.
+        start_tag (str): SGR start sequence; an empty string leaves the text unchanged.
+
+    Returns:
+        str: Colorized text.
+    """
+    if not start_tag:
+        return text
+    # str.__contains__ searches the rendered text; ColoredData's `in` checks its original data.
+    if str.__contains__(text, _RESET):
+        text = text.replace(_RESET, _RESET + start_tag)
+    return start_tag + text + _RESET
+
+
+def _classify_scalar(value: Any) -> Tuple[int, str]:
+    """
+    Selects the theme role and literal text for a non-container, non-string value.
+
+    Args:
+        value (Any): Value to classify.
+
+    Returns:
+        Tuple[int, str]: (theme role, literal text to render).
+    """
+    if isinstance(value, bool):
+        return _BOOL, str(value).lower()
+    if isinstance(value, (int, float)):
+        return _NUMBER, str(value)
+    if value is None:
+        return _NULL, "null"
+    return _OTHER, str(value)
 
 
 class DataHandler(OutputHandler):
     """Handles output formatting and colorization for various data types (primarily JSON-like)."""
 
     colorizer: Optional[Colorizer]
+    _WALKER_CACHE_SIZE: int = 32
 
     def __init__(self, colorizer: Optional[Colorizer] = None) -> None:
         """
@@ -676,6 +791,7 @@ class DataHandler(OutputHandler):
             Defaults to a new Colorizer
         """
         self.colorizer: Colorizer = colorizer or Colorizer()
+        self._walkers: Dict[tuple, Callable[[Any, int, List[str]], None]] = {}
 
     def format(self, data: Any, theme_colors: Dict) -> str:
         """
@@ -688,7 +804,9 @@ class DataHandler(OutputHandler):
         Returns:
             str: Formatted and colorized data as a string.
         """
-        if isinstance(data, str):
+        # Only attempt a parse when the text could start a JSON document; plain words
+        # would otherwise raise and catch a JSONDecodeError on every call.
+        if isinstance(data, str) and data.lstrip()[:1] in _JSON_START_CHARS:
             with contextlib.suppress(json.JSONDecodeError):
                 data = json.loads(data)
 
@@ -710,72 +828,142 @@ class DataHandler(OutputHandler):
         """
         if self.colorizer is None:
             self.colorizer = Colorizer()
-        indent = "  " * indent_level
-        colored_output = []
-
-
-        if isinstance(data, dict):
-            colored_output.append(self.colorizer.colorize("{", "grey"))
-            for i, (key, value) in enumerate(data.items()):
-                colored_output.extend(
-                    (
-                        f"\n{indent}  ",
-                        f'"{self.colorizer.colorize(str(key), theme_colors["key"])}": ',
-                        (
-                            self._theme_colorize_data(
-                                value, theme_colors, indent_level + 1
-                            )
-                            if value is not None and not isinstance(value, str) and not self._is_colorized(value)
-                            else (
-                                value if self._is_colorized(value)
-                                else self.colorizer.colorize(str(value), theme_colors["string"])
-                            )
-                        ),
-                    )
-                )
-                if i < len(data) - 1:
-                    colored_output.append(self.colorizer.colorize(",", "grey"))
-            colored_output.append(f"\n{indent}{self.colorizer.colorize('}', 'grey')}")
-
-        elif isinstance(data, list):
-            colored_output.append(self.colorizer.colorize("[", "grey"))
-            for i, item in enumerate(data):
-                colored_output.extend(
-                    (
-                        f"\n{indent}  ",
-                        self._theme_colorize_data(item, theme_colors, indent_level + 1),
-                    )
-                )
-                if i < len(data) - 1:
-                    colored_output.append(self.colorizer.colorize(",", "grey"))
-            colored_output.append(f"\n{indent}{self.colorizer.colorize(']', 'grey')}")
+        # Walkers are keyed on the resolved start sequences rather than the theme, so
+        # swapping the colorizer or editing its colors picks up the new codes.
+        tags = self._resolve_theme(theme_colors)
+        walk = self._walkers.get(tags)
+        if walk is None:
+            if len(self._walkers) >= self._WALKER_CACHE_SIZE:
+                self._walkers.clear()
+            walk = self._walkers[tags] = self._build_walker(tags)
+        parts: List[str] = []
+        walk(data, indent_level, parts)
+        return "".join(parts)
+
+    def _resolve_theme(self, theme_colors: Dict) -> Tuple[str, ...]:
+        """
+        Resolves a theme into a table of start sequences indexed by theme role.
 
-        elif isinstance(data, bool):
-            colored_output.append(
-                self.colorizer.colorize(str(data).lower(), theme_colors["bool"])
-            )
-        elif isinstance(data, (int, float)):
-            colored_output.append(
-                self.colorizer.colorize(str(data), theme_colors["number"])
-            )
-        elif data is None:
-            colored_output.append(self.colorizer.colorize("null", theme_colors["null"]))
+        Roles missing from the theme are left uncolored.
+
+        Args:
+            theme_colors (Dict): Dictionary of theme colors.
+
+        Returns:
+            Tuple[str, ...]: Start sequence for each theme role.
+        """
+        get_color_code = self.colorizer.get_color_code
+        tags = [get_color_code(theme_colors.get(role)) for role in _THEME_ROLES]
+        tags.append(get_color_code("grey"))
+        return tuple(tags)
+
+    def _build_walker(self, tags: Tuple[str, ...]) -> Callable[[Any, int, List[str]], None]:
+        """
+        Builds a recursive renderer specialized for one resolved theme.
 
-        elif isinstance(data, str):
+        Start sequences, punctuation and the null/true/false tokens are rendered once
+        here and captured by the returned closures, so walking the data does no theme
+        lookups. Each node is dispatched on its exact type, falling back to isinstance
+        checks for subclasses. Tokens are appended onto a shared list, which the caller
+        joins once.
+
+        Args:
+            tags (Tuple[str, ...]): Start sequence for each theme role, from _resolve_theme.
+
+        Returns:
+            Callable[[Any, int, List[str]], None]: walk(data, indent_level, parts).
+        """
+        paint = _paint
+        key_tag = tags[_KEY]
+        string_tag = tags[_STRING]
+        number_tag = tags[_NUMBER]
+        grey = tags[_PUNCTUATION]
+        open_brace = _paint("{", grey)
+        close_brace = _paint("}", grey)
+        open_bracket = _paint("[", grey)
+        close_bracket = _paint("]", grey)
+        comma = _paint(",", grey)
+        null_token = _paint("null", tags[_NULL])
+        true_token = _paint("true", tags[_BOOL])
+        false_token = _paint("false", tags[_BOOL])
+        is_colorized = self._is_colorized
+
+        def walk_dict(data: Dict, indent_level: int, parts: List[str]) -> None:
+            indent = "  " * indent_level
+            append = parts.append
+            lookup = dispatch.get
+            append(open_brace)
+            # Every entry after the first is led by the comma, so separator, indent
+            # and key go out as a single token.
+            separator = f"\n{indent}  "
+            next_separator = comma + separator
+            for key, value in data.items():
+                append(f'{separator}"{paint(str(key), key_tag)}": ')
+                separator = next_separator
+                if value is None or isinstance(value, str):
+                    append(value if is_colorized(value) else paint(str(value), string_tag))
+                else:
+                    lookup(type(value), walk_other)(value, indent_level + 1, parts)
+            append(f"\n{indent}{close_brace}")
+
+        def walk_list(data: List, indent_level: int, parts: List[str]) -> None:
+            indent = "  " * indent_level
+            append = parts.append
+            lookup = dispatch.get
+            append(open_bracket)
+            separator = f"\n{indent}  "
+            next_separator = comma + separator
+            for item in data:
+                append(separator)
+                separator = next_separator
+                lookup(type(item), walk_other)(item, indent_level + 1, parts)
+            append(f"\n{indent}{close_bracket}")
+
+        def walk_str(data: str, indent_level: int, parts: List[str]) -> None:
             # CHECK: Does this string already contain ANSI escape codes?
-            if self._is_colorized(data):
+            if is_colorized(data):
                 # It's already colored. Keep it as-is (no extra quoting/escaping).
-                colored_output.append(data)
+                parts.append(data)
             else:
-                colored_output.append(
-                    self.colorizer.colorize(f'"{data}"', theme_colors["string"])
-                )
-        else:
-            colored_output.append(
-                self.colorizer.colorize(str(data), theme_colors["other"])
-            )
+                parts.append(paint(f'"{data}"', string_tag))
+
+        def walk_number(data: Union[int, float], indent_level: int, parts: List[str]) -> None:
+            parts.append(paint(str(data), number_tag))
 
-        return "".join(colored_output)
+        def walk_bool(data: bool, indent_level: int, parts: List[str]) -> None:
+            parts.append(true_token if data else false_token)
+
+        def walk_null(data: None, indent_level: int, parts: List[str]) -> None:
+            parts.append(null_token)
+
+        def walk_other(data: Any, indent_level: int, parts: List[str]) -> None:
+            # Subclasses of the dispatched types, and anything else.
+            if isinstance(data, dict):
+                walk_dict(data, indent_level, parts)
+            elif isinstance(data, list):
+                walk_list(data, indent_level, parts)
+            elif isinstance(data, str):
+                walk_str(data, indent_level, parts)
+            else:
+                kind, literal = _classify_scalar(data)
+                parts.append(paint(literal, tags[kind]))
+
+        dispatch: Dict[type, Callable[[Any, int, List[str]], None]] = {
+            dict: walk_dict,
+            list: walk_list,
+            str: walk_str,
+            int: walk_number,
+            float: walk_number,
+            bool: walk_bool,
+            type(None): walk_null,
+        }
+
+        # Container walkers dispatch their children directly rather than through walk,
+        # so each nesting level costs one Python frame.
+        def walk(data: Any, indent_level: int, parts: List[str]) -> None:
+            dispatch.get(type(data), walk_other)(data, indent_level, parts)
+
+        return walk
 
     def _is_colorized(self, text):
         """Detect if a string already contains ANSI escape codes."""
@@ -788,6 +976,17 @@ default_colorizer = Colorizer(output_handler=DataHandler())
 class YamlHandler(OutputHandler):
     """Handles output formatting as YAML with colorization."""
 
+    def __init__(self) -> None:
+        """Initializes YamlHandler with the dumper and options used for every format call."""
+        # libyaml's CDumper escapes non-BMP characters (e.g. emoji) even with
+        # allow_unicode, so the pure-Python dumper is used to keep them readable.
+        self._dumper = yaml.Dumper
+        self._dump_kwargs: Dict[str, Any] = {
+            "indent": 2,
+            "allow_unicode": True,
+            "default_flow_style": False,
+        }
+
     def format(self, data: Any, theme_colors: Dict) -> str:
         """
         Formats data as colorized YAML.
@@ -799,9 +998,7 @@ class YamlHandler(OutputHandler):
         Returns:
             str: Colorized YAML string.
         """
-        yaml_string: str = yaml.dump(
-            data, indent=2, allow_unicode=True, default_flow_style=False
-        )
+        yaml_string: str = yaml.dump(data, Dumper=self._dumper, **self._dump_kwargs)
         return self._colorize_yaml_string(yaml_string, theme_colors)
 
     def _colorize_yaml_string(
@@ -869,9 +1066,17 @@ class YamlHandler(OutputHandler):
         return colored_yaml
 
 
+# Matches ANSI escape sequences (CSI sequences such as SGR color codes, and 2-byte escapes)
+_ANSI_ESCAPE_RE = re.compile(r"\x1b(?:[@-Z\\-_]|\[[0-?]+[ -/]*[@-~])")
+
+
 class ColorRemoverHandler(OutputHandler):
     """Handles removing ANSI color codes from formatted output."""
 
+    def __init__(self) -> None:
+        """Initializes ColorRemoverHandler with the DataHandler used for initial formatting."""
+        self._data_handler = DataHandler()
+
     def format(self, data: Any, theme_colors: Dict) -> str:
         """
         Removes color from the formatted output using DataHandler for initial formatting.
@@ -883,8 +1088,7 @@ class ColorRemoverHandler(OutputHandler):
         Returns:
             str: Text with ANSI color codes removed.
         """
-        handler = DataHandler()
-        formatted_text = handler.format(data, theme_colors)
+        formatted_text = self._data_handler.format(data, theme_colors)
         return self._remove_ansi_colors(formatted_text)
 
     def _remove_ansi_colors(self, text: str) -> str:
@@ -897,8 +1101,9 @@ class ColorRemoverHandler(OutputHandler):
         Returns:
             str: Text with ANSI color codes removed.
         """
-        ansi_escape = re.compile(r"\x1b(?:[@-Z\\-_]|\[[0-?]+[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        if "\x1b" not in text:
+            return text
+        return _ANSI_ESCAPE_RE.sub("", text)
 
 
 def create_single_wrap(color_name: str) -> Dict:
@@ -964,132 +1169,70 @@ def wrapmono(color: str = "white") -> Callable:
     )
 
 
-def black(text: str) -> str:
-    return default_colorizer.colorize(text, "black")
-
-
-def white(text: str) -> str:
-    return default_colorizer.colorize(text, "white")
-
-
-def red(text: str) -> str:
-    return default_colorizer.colorize(text, "red")
-
-
-def green(text: str) -> str:
-    return default_colorizer.colorize(text, "green")
-
-
-def yellow(text: str) -> str:
-    return default_colorizer.colorize(text, "yellow")
-
-
-def blue(text: str) -> str:
-    return default_colorizer.colorize(text, "blue")
-
-
-def magenta(text: str) -> str:
-    return default_colorizer.colorize(text, "magenta")
-
-
-def cyan(text: str) -> str:
-    return default_colorizer.colorize(text, "cyan")
-
-
-def bright_black(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_black")
-
-
-def bright_white(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_white")
-
-
-def bright_red(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_red")
-
-
-def bright_green(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_green")
-
-
-def bright_yellow(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_yellow")
-
-
-def bright_blue(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_blue")
-
-
-def bright_magenta(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_magenta")
-
-
-def bright_cyan(text: str) -> str:
-    return default_colorizer.colorize(text, "bright_cyan")
-
-
-def bg_black(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="black")
-
-
-def bg_white(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="white")
-
-
-def bg_red(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="red")
-
-
-def bg_green(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="green")
-
-
-def bg_yellow(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="yellow")
-
-
-def bg_blue(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="blue")
-
-
-def bg_magenta(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="magenta")
-
-
-def bg_cyan(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="cyan")
-
-
-def bg_brblack(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_black")
-
-
-def bg_brwhite(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_white")
-
-
-def bg_brred(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_red")
-
-
-def bg_brgreen(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_green")
-
-
-def bg_bryellow(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_yellow")
-
-
-def bg_brblue(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_blue")
-
-
-def bg_brmagenta(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_magenta")
+def _make_color(
+    name: str, color: Optional[str] = None, background_color: Optional[str] = None
+) -> Callable[[str], str]:
+    """
+    Creates a direct color function with its start sequence bound at definition time.
 
+    Args:
+        name (str): Name given to the created function.
+        color (Optional[str], optional): Foreground color name. Defaults to None.
+        background_color (Optional[str], optional): Background color name. Defaults to None.
 
-def bg_brcyan(text: str) -> str:
-    return default_colorizer.colorize(text, background_color="bright_cyan")
+    Returns:
+        Callable[[str], str]: Function wrapping text in the color, re-applying it after nested resets.
+    """
+    start_tag = default_colorizer._build_start_tag(color, background_color)
+    end_tag = _RESET
+    restart = end_tag + start_tag
+    # Empty input always renders the same codes, so one result is shared.
+    empty = ColoredData(start_tag + end_tag, "")
+
+    def color_func(text: str) -> str:
+        if type(text) is str and not text:
+            return empty
+        # str.__contains__ searches the rendered text; ColoredData's `in` checks its original data.
+        if str.__contains__(text, end_tag):
+            return ColoredData(start_tag + text.replace(end_tag, restart) + end_tag, text)
+        return ColoredData(start_tag + text + end_tag, text)
+
+    color_func.__name__ = color_func.__qualname__ = name
+    return color_func
+
+
+black = _make_color("black", "black")
+white = _make_color("white", "white")
+red = _make_color("red", "red")
+green = _make_color("green", "green")
+yellow = _make_color("yellow", "yellow")
+blue = _make_color("blue", "blue")
+magenta = _make_color("magenta", "magenta")
+cyan = _make_color("cyan", "cyan")
+bright_black = _make_color("bright_black", "bright_black")
+bright_white = _make_color("bright_white", "bright_white")
+bright_red = _make_color("bright_red", "bright_red")
+bright_green = _make_color("bright_green", "bright_green")
+bright_yellow = _make_color("bright_yellow", "bright_yellow")
+bright_blue = _make_color("bright_blue", "bright_blue")
+bright_magenta = _make_color("bright_magenta", "bright_magenta")
+bright_cyan = _make_color("bright_cyan", "bright_cyan")
+bg_black = _make_color("bg_black", background_color="black")
+bg_white = _make_color("bg_white", background_color="white")
+bg_red = _make_color("bg_red", background_color="red")
+bg_green = _make_color("bg_green", background_color="green")
+bg_yellow = _make_color("bg_yellow", background_color="yellow")
+bg_blue = _make_color("bg_blue", background_color="blue")
+bg_magenta = _make_color("bg_magenta", background_color="magenta")
+bg_cyan = _make_color("bg_cyan", background_color="cyan")
+bg_brblack = _make_color("bg_brblack", background_color="bright_black")
+bg_brwhite = _make_color("bg_brwhite", background_color="bright_white")
+bg_brred = _make_color("bg_brred", background_color="bright_red")
+bg_brgreen = _make_color("bg_brgreen", background_color="bright_green")
+bg_bryellow = _make_color("bg_bryellow", background_color="bright_yellow")
+bg_brblue = _make_color("bg_brblue", background_color="bright_blue")
+bg_brmagenta = _make_color("bg_brmagenta", background_color="bright_magenta")
+bg_brcyan = _make_color("bg_brcyan", background_color="bright_cyan")
 
 
 darktheme = default_colorizer.create_themed_decorator_factory("dark", dark_theme_colors)
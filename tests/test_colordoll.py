@@ -0,0 +1,192 @@
+import re
+
+from colordoll.colordoll import (
+    AnsiColor,
+    ColorConfig,
+    Colorizer,
+    DataHandler,
+    OutputHandler,
+    YamlHandler,
+    _PAIR_TAGS,
+    dark_theme_colors,
+    darktheme,
+    light_theme_colors,
+    red,
+)
+
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+DATA = {"name": "doll", "count": 3, "ratio": 1.5, "ok": True, "none": None, "items": [1, "two", [3]]}
+
+
+def strip_ansi(text):
+    return ANSI_RE.sub("", text)
+
+
+def rendered(text):
+    # ColoredData compares equal to its original data, so compare the colored text.
+    return str.__str__(text)
+
+
+class CountingHandler(OutputHandler):
+    """Stateful handler: its output changes on every call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def format(self, data, theme_colors):
+        self.calls += 1
+        return f"#{self.calls}"
+
+
+def test_colorize_repeated_call_matches_fresh_colorizer():
+    colorizer = Colorizer()
+    first = rendered(colorizer.colorize("text", "red", "bg_blue"))
+    again = rendered(colorizer.colorize("text", "red", "bg_blue"))
+    fresh = rendered(Colorizer().colorize("text", "red", "bg_blue"))
+    assert first == again == fresh == "\033[31;44mtext\033[0m"
+
+
+def test_bg_prefix_resolves_in_colorize_and_getter():
+    colorizer = Colorizer()
+    assert rendered(colorizer.colorize("x", background_color="bg_blue")) == "\033[44mx\033[0m"
+    assert colorizer.get_bg_color_code("bg_blue") == colorizer.get_bg_color_code("blue") == "\033[44m"
+    assert colorizer.get_bg_color_code("BG_Blue") == "\033[44m"
+    assert colorizer.get_bg_color_code("bg_nope") == ""
+
+
+def test_colorize_honors_instance_color_edits():
+    colorizer = Colorizer()
+    colorizer.colorize("x", "red")
+    colorizer.colors["red"] = AnsiColor(91, "red")
+    assert rendered(colorizer.colorize("x", "red")) == "\033[91mx\033[0m"
+    assert rendered(colorizer.colorize("x", "red", "blue")) == "\033[91;44mx\033[0m"
+    assert rendered(Colorizer().colorize("x", "red")) == "\033[31mx\033[0m"
+
+
+def test_custom_color_stays_on_its_instance():
+    colorizer = Colorizer()
+    colorizer.colors["pink"] = AnsiColor(95, "pink")
+    assert rendered(colorizer.colorize("x", "pink")) == "\033[95mx\033[0m"
+    assert rendered(Colorizer().colorize("x", "pink")) == "x"
+
+
+def test_color_decorator_honors_color_edits_for_every_result_type():
+    colorizer = Colorizer()
+    identity = colorizer.color_decorator("red")(lambda value: value)
+    assert rendered(identity("s")) == "\033[31ms\033[0m"
+    colorizer.colors["red"] = AnsiColor(91, "red")
+    assert rendered(identity("s")) == "\033[91ms\033[0m"
+    assert rendered(identity(1)) == "\033[91m1\033[0m"
+
+
+def test_nested_reset_in_colored_data_reapplies_outer_color():
+    inner = darktheme(False)(lambda: {"a": 1})()
+    resets = rendered(inner).count("\033[0m")
+    for outer in (red(inner), Colorizer().colorize(inner, "red")):
+        assert rendered(outer).count("\033[0m\033[31m") == resets
+        assert outer == {"a": 1}
+
+
+def test_unknown_color_names_do_not_grow_pair_table():
+    colorizer = Colorizer()
+    size = len(_PAIR_TAGS)
+    for i in range(100):
+        assert rendered(colorizer.colorize("x", f"nope{i}", "blue")) == "\033[44mx\033[0m"
+    assert len(_PAIR_TAGS) == size
+
+
+def test_walker_cache_hit_matches_fresh_render():
+    handler = DataHandler()
+    first = handler.format(DATA, dark_theme_colors)
+    assert handler.format(DATA, dark_theme_colors) == first
+    assert DataHandler().format(DATA, dark_theme_colors) == first
+
+
+def test_walker_rebuilt_when_theme_changes():
+    handler = DataHandler()
+    dark = handler.format(DATA, dark_theme_colors)
+    light = handler.format(DATA, light_theme_colors)
+    assert light != dark
+    assert light == DataHandler().format(DATA, light_theme_colors)
+    assert strip_ansi(light) == strip_ansi(dark)
+
+
+def test_walker_rebuilt_when_colorizer_replaced():
+    handler = DataHandler()
+    handler.format(DATA, dark_theme_colors)
+    other = Colorizer()
+    other.colors["bright_cyan"] = AnsiColor(36, "bright_cyan")
+    handler.colorizer = other
+    assert '"\033[36mname\033[0m"' in handler.format(DATA, dark_theme_colors)
+
+
+def test_walker_rebuilt_when_colorizer_colors_edited():
+    handler = DataHandler()
+    assert '"\033[96mname\033[0m"' in handler.format(DATA, dark_theme_colors)
+    handler.colorizer.colors["bright_cyan"] = AnsiColor(36, "bright_cyan")
+    assert '"\033[36mname\033[0m"' in handler.format(DATA, dark_theme_colors)
+
+
+def test_deeply_nested_data_renders():
+    for depth in (600, 900):
+        data = []
+        for _ in range(depth):
+            data = [data]
+        assert strip_ansi(DataHandler().format(data, dark_theme_colors)).count("[") == depth + 1
+
+
+def test_themed_decorator_formats_on_every_call():
+    colorizer = Colorizer(output_handler=CountingHandler())
+    themed = colorizer.create_themed_decorator_factory("dark", dark_theme_colors)
+
+    @themed(False)
+    def result():
+        return {"a": 1}
+
+    assert rendered(result()) == "#1"
+    assert rendered(result()) == "#2"
+
+
+def test_themed_decorator_follows_output_handler_change():
+    colorizer = Colorizer(output_handler=DataHandler())
+    themed = colorizer.create_themed_decorator_factory("dark", dark_theme_colors)
+
+    @themed(False)
+    def result():
+        return {"a": 1}
+
+    assert "\033[" in rendered(result())
+    colorizer.set_output_handler(CountingHandler())
+    assert rendered(result()) == "#1"
+
+
+def test_equal_numbers_and_bools_render_distinctly():
+    colorizer = Colorizer(output_handler=DataHandler())
+    themed = colorizer.create_themed_decorator_factory("dark", dark_theme_colors)
+    values = iter([1, 1.0, True, 1])
+
+    @themed(False)
+    def result():
+        return next(values)
+
+    assert [strip_ansi(result()) for _ in range(4)] == ["1", "1.0", "true", "1"]
+    output = colorizer.theme_colorize([1, 1.0, True], dark_theme_colors)
+    assert strip_ansi(output).split() == ["[", "1,", "1.0,", "true", "]"]
+
+
+def test_yaml_keeps_non_bmp_characters():
+    output = YamlHandler().format({"status": "deploy ✅ 🚀"}, dark_theme_colors)
+    assert "🚀" in strip_ansi(output)
+
+
+def test_color_config_follows_config_edits_and_replacement():
+    source = {"pink": {"code": 95}}
+    config = ColorConfig(source)
+    assert config.get_color_code("pink") == "\033[95m"
+    source["pink"] = {"code": 35}
+    assert config.get_color_code("pink") == "\033[35m"
+    source["pink"]["code"] = 36
+    assert config.get_color_code("pink") == "\033[36m"
+    config.config = {}
+    assert config.get_color_code("pink") == ""